@@ -1,13 +1,23 @@
 from os import getcwd, environ
 from typing import Literal
-from dotenv import load_dotenv
-from .models.base import BaseModel
+from dotenv import dotenv_values
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv(f"{getcwd()}/.env")
 
+__all__ = ("Config", "CONFIG")
 
-class Config(BaseModel):
-    """Type definition for config values."""
+
+# the whole .env file is exported like load_dotenv() did, so other environ readers (e.g. get_node_id()) still see it.
+# values already set in the environment take priority
+for _key, _value in dotenv_values(f"{getcwd()}/.env").items():
+    if _value is not None:
+        environ.setdefault(_key, _value)
+
+
+class Config(BaseSettings):
+    """Type definition for config values. Values are read from the environment, which includes the .env file."""
+
+    model_config = SettingsConfigDict(extra="ignore", validate_default=False, case_sensitive=True)
 
     DISCORD_TOKEN: str = None
     BOT_RELEASE: Literal["LOCAL", "CANARY", "MAIN", "PRO"]
@@ -35,6 +45,10 @@ class Config(BaseModel):
     SHARD_COUNT: int = 1
     SHARDS_PER_NODE: int = 1
     #############################
+    # seconds each process keeps fetched database items in memory, 0 turns it off.
+    # only this process's own writes invalidate it, so multi-node deployments may want it off
+    LOCAL_CACHE_TTL: int = 30
+    #############################
     TEST_MODE: bool = False  # if true, skip database and redis connections
 
     def model_post_init(self, __context):
@@ -49,7 +63,7 @@ class Config(BaseModel):
             raise ValueError(
                 "REDIS_URL or REDIS_HOST/REDIS_PORT/REDIS_PASSWORD must be set")
 
-        if all([self.REDIS_HOST, self.REDIS_PORT, self.REDIS_PASSWORD, self.REDIS_URL]):
+        if self.REDIS_URL and self.REDIS_HOST and self.REDIS_PORT and self.REDIS_PASSWORD:
             raise ValueError(
                 "REDIS_URL and REDIS_HOST/REDIS_PORT/REDIS_PASSWORD cannot both be set")
 
@@ -59,11 +73,9 @@ class Config(BaseModel):
             raise ValueError(
                 "MONGO_URL or MONGO_HOST/MONGO_PORT/MONGO_USER/MONGO_PASSWORD must be set")
 
-        if all([self.MONGO_HOST, self.MONGO_PORT, self.MONGO_USER, self.MONGO_PASSWORD, self.MONGO_URL]):
+        if self.MONGO_URL and self.MONGO_HOST and self.MONGO_PORT and self.MONGO_USER and self.MONGO_PASSWORD:
             raise ValueError(
                 "MONGO_URL and MONGO_HOST/MONGO_PORT/MONGO_USER/MONGO_PASSWORD cannot both be set")
 
 
-CONFIG: Config = Config(
-    **{field: value for field, value in environ.items() if field in Config.model_fields}
-)
+CONFIG: Config = Config()
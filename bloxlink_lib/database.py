@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-import json
+from copy import deepcopy
+from itertools import chain
 from os.path import exists
 from typing import Type, TYPE_CHECKING, Any
 
+from cachetools import TTLCache
 from motor.motor_asyncio import AsyncIOMotorClient
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.commands.core import AsyncScript
 from redis import ConnectionError as RedisConnectionError
+from pydantic_core import to_json
 
 from bloxlink_lib.models import users, guilds
 from bloxlink_lib import BaseModel
@@ -17,13 +22,33 @@ from .config import CONFIG
 mongo: AsyncIOMotorClient = None
 redis: Redis = None
 
+_CACHE_TTL_SECONDS: int = 3600  # how long cached items live in redis
+
+# sets the hash fields and the expiry in one round trip. ARGV[1] is the TTL, followed by field/value pairs
+HSET_WITH_EXPIRY_SCRIPT = """
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+"""
+_hset_with_expiry: AsyncScript = None
+
+# in-process cache in front of redis: {(domain, item_id): {aspects: item}}. turned off with LOCAL_CACHE_TTL=0
+_LOCAL_CACHE_ENABLED: bool = CONFIG.LOCAL_CACHE_TTL > 0
+_local_cache: TTLCache[tuple[str, str], dict[tuple[str, ...], dict]] = TTLCache(
+    maxsize=10_000, ttl=max(CONFIG.LOCAL_CACHE_TTL, 1))
+
 if TYPE_CHECKING:
     from . import MemberSerializable, GuildSerializable
 
 
 def connect_database():
+    """Connect to MongoDB and Redis. Does nothing if the clients were already created."""
+
     global mongo  # pylint: disable=global-statement
     global redis  # pylint: disable=global-statement
+    global _hset_with_expiry  # pylint: disable=global-statement
+
+    if mongo is not None and redis is not None:
+        return
 
     mongo_options: dict[str, str | int] = {}
 
@@ -68,7 +93,7 @@ def connect_database():
     redis._old_set = redis.set  # pylint: disable=protected-access
     redis.set = redis_set
 
-    # loop.create_task(_heartbeat_loop()) # TODO: fix this
+    _hset_with_expiry = redis.register_script(HSET_WITH_EXPIRY_SCRIPT)
 
 
 async def redis_set(key: str, value: BaseModel | Any, expire: datetime.timedelta | int = None, **kwargs):
@@ -76,20 +101,19 @@ async def redis_set(key: str, value: BaseModel | Any, expire: datetime.timedelta
 
     await redis._old_set(key,  # pylint: disable=protected-access
                          value.model_dump_json() if isinstance(value, BaseModel) else (
-                             json.dumps(value) if isinstance(value, (list, dict)) else value),
+                             to_json(value) if isinstance(value, (list, dict)) else value),
                          ex=int(expire.total_seconds()) if expire and isinstance(
                              expire, datetime.timedelta) else expire,
                          **kwargs)
 
 
-async def _heartbeat_loop():
-    while True:
-        try:
-            await asyncio.wait_for(redis.ping(), timeout=10)
-        except RedisConnectionError as e:
-            raise SystemError("Failed to connect to Redis.") from e
+async def redis_hset_with_expiry(key: str, mapping: dict[str, Any], expire: int = _CACHE_TTL_SECONDS, client: Pipeline = None):
+    """Set fields of a Redis hash and refresh its expiry with a single command.
 
-        await asyncio.sleep(5)
+    Pass a pipeline as ``client`` to queue the command instead of sending it immediately.
+    """
+
+    await _hset_with_expiry(keys=[key], args=[expire, *chain.from_iterable(mapping.items())], client=client)
 
 
 async def wait_for_redis():
@@ -108,14 +132,25 @@ async def fetch_item[T](domain: str, constructor: Type[T], item_id: str, *aspect
     """
     Fetch an item from local cache, then redis, then database.
     Will populate caches for later access
+
+    The local cache is per process and only invalidated by this process's update_item(). Writes from other
+    workers or nodes can be missed for up to CONFIG.LOCAL_CACHE_TTL seconds (30 by default). Set it to 0 to
+    turn the local cache off.
     """
-    # should check local cache but for now just fetch from redis
+
+    if _LOCAL_CACHE_ENABLED:
+        local_items = _local_cache.get((domain, item_id))
+
+        if local_items and aspects in local_items:
+            return constructor(**deepcopy(local_items[aspects]))
+
+    cache_key = f"{domain}:{item_id}"
 
     if aspects:
-        item = await redis.hmget(f"{domain}:{item_id}", *aspects)
+        item = await redis.hmget(cache_key, *aspects)
         item = {x: y for x, y in zip(aspects, item) if y is not None}
     else:
-        item = await redis.hgetall(f"{domain}:{item_id}")
+        item = await redis.hgetall(cache_key)
 
     if not item:
         item = await mongo.bloxlink[domain].find_one({"_id": item_id}, {x: True for x in aspects}) or {
@@ -128,21 +163,18 @@ async def fetch_item[T](domain: str, constructor: Type[T], item_id: str, *aspect
                     x) and not isinstance(item[x], dict)}
 
                 if items:
-                    async with redis.pipeline() as pipeline:
-                        await pipeline.hmset(f"{domain}:{item_id}", items)
-                        await pipeline.expire(f"{domain}:{item_id}", int(datetime.timedelta(hours=1).total_seconds()))
-                        await pipeline.execute()
+                    await redis_hset_with_expiry(cache_key, items)
             else:
-                async with redis.pipeline() as pipeline:
-                    await pipeline.hmset(f"{domain}:{item_id}", item)
-                    await pipeline.expire(f"{domain}:{item_id}", int(datetime.timedelta(hours=1).total_seconds()))
-                    await pipeline.execute()
+                await redis_hset_with_expiry(cache_key, item)
 
     if item.get("_id"):
         item.pop("_id")
 
     item["id"] = item_id
 
+    if _LOCAL_CACHE_ENABLED:
+        _local_cache.setdefault((domain, item_id), {})[aspects] = deepcopy(item)
+
     return constructor(**item)
 
 
@@ -151,8 +183,12 @@ async def update_item(domain: str, item_id: str, **aspects) -> None:
     Update an item's aspects in local cache, redis, and database.
     """
 
+    _local_cache.pop((domain, item_id), None)
+
+    cache_key = f"{domain}:{item_id}"
     unset_aspects = {}
     set_aspects = {}
+    redis_set_aspects = {}
 
     for key, val in aspects.items():
         if val is None:
@@ -160,38 +196,47 @@ async def update_item(domain: str, item_id: str, **aspects) -> None:
         else:
             set_aspects[key] = val
 
+            if not isinstance(val, (dict, list, bool)):  # TODO
+                redis_set_aspects[key] = val
+
     # check if the model is valid
     if domain == "users":
         users.UserData(id=item_id, **set_aspects)
     elif domain == "guilds":
         guilds.GuildData(id=item_id, **set_aspects)
 
-    # Update redis cache
-    redis_set_aspects = {}
-    redis_unset_aspects = {}
+    # Update redis cache in one round trip. Pipeline commands are buffered, not awaited.
+    if redis_set_aspects or unset_aspects:
+        pipe = redis.pipeline(transaction=False)
 
-    for aspect_name, aspect_value in dict(aspects).items():
-        if aspect_value is None:
-            redis_unset_aspects[aspect_name] = aspect_value
-        elif isinstance(aspect_value, (dict, list, bool)):  # TODO
-            pass
-        else:
-            redis_set_aspects[aspect_name] = aspect_value
+        if redis_set_aspects:
+            await redis_hset_with_expiry(cache_key, redis_set_aspects, client=pipe)
 
-    if redis_set_aspects:
-        async with redis.pipeline() as pipeline:
-            await pipeline.hset(f"{domain}:{item_id}", mapping=redis_set_aspects)
-            await pipeline.expire(f"{domain}:{item_id}", int(datetime.timedelta(hours=1).total_seconds()))
-            await pipeline.execute()
+        if unset_aspects:
+            pipe.hdel(cache_key, *unset_aspects.keys())
 
-    if redis_unset_aspects:
-        await redis.hdel(f"{domain}:{item_id}", *redis_unset_aspects.keys())
+        await pipe.execute()
 
     # update database
     await mongo.bloxlink[domain].update_one(
         {"_id": item_id}, {"$set": set_aspects, "$unset": unset_aspects}, upsert=True
     )
 
+    # invalidate again: a fetch_item() that ran during the writes may have re-cached the old values
+    _local_cache.pop((domain, item_id), None)
+
+
+def _coerce_id(obj: str | int | dict | MemberSerializable | GuildSerializable) -> str:
+    """Get the string ID of a user or guild from a raw ID, dict, or serializable."""
+
+    match obj:
+        case dict():
+            return str(obj["id"])
+        case users.MemberSerializable() | guilds.GuildSerializable():
+            return str(obj.id)
+        case _:
+            return str(obj)
+
 
 async def fetch_user_data(user: str | int | dict | MemberSerializable, *aspects) -> users.UserData:
     """
@@ -199,14 +244,7 @@ async def fetch_user_data(user: str | int | dict | MemberSerializable, *aspects)
     Will populate caches for later access
     """
 
-    if isinstance(user, dict):
-        user_id = str(user["id"])
-    elif isinstance(user, users.MemberSerializable):
-        user_id = str(user.id)
-    else:
-        user_id = str(user)
-
-    return await fetch_item("users", users.UserData, user_id, *aspects)
+    return await fetch_item("users", users.UserData, _coerce_id(user), *aspects)
 
 
 async def fetch_guild_data(guild: str | int | dict | GuildSerializable, *aspects) -> guilds.GuildData:
@@ -215,14 +253,7 @@ async def fetch_guild_data(guild: str | int | dict | GuildSerializable, *aspects
     Will populate caches for later access
     """
 
-    if isinstance(guild, dict):
-        guild_id = str(guild["id"])
-    elif isinstance(guild, guilds.GuildSerializable):
-        guild_id = str(guild.id)
-    else:
-        guild_id = str(guild)
-
-    return await fetch_item("guilds", guilds.GuildData, guild_id, *aspects)
+    return await fetch_item("guilds", guilds.GuildData, _coerce_id(guild), *aspects)
 
 
 async def update_user_data(user: str | int | dict | MemberSerializable, **aspects) -> None:
@@ -230,14 +261,7 @@ async def update_user_data(user: str | int | dict | MemberSerializable, **aspect
     Update a user's aspects in local cache, redis, and database.
     """
 
-    if isinstance(user, dict):
-        user_id = str(user["id"])
-    elif isinstance(user, users.MemberSerializable):
-        user_id = str(user.id)
-    else:
-        user_id = str(user)
-
-    return await update_item("users", user_id, **aspects)
+    return await update_item("users", _coerce_id(user), **aspects)
 
 
 async def update_guild_data(guild: str | int | dict | GuildSerializable, **aspects) -> None:
@@ -245,14 +269,9 @@ async def update_guild_data(guild: str | int | dict | GuildSerializable, **aspec
     Update a guild's aspects in local cache, redis, and database.
     """
 
-    if isinstance(guild, dict):
-        guild_id = str(guild["id"])
-    elif isinstance(guild, guilds.GuildSerializable):
-        guild_id = str(guild.id)
-    else:
-        guild_id = str(guild)
-
-    return await update_item("guilds", guild_id, **aspects)
+    return await update_item("guilds", _coerce_id(guild), **aspects)
 
 
-connect_database()
+# TEST_MODE skips the connection; tests and tools can call connect_database() themselves
+if not CONFIG.TEST_MODE:
+    connect_database()
@@ -1,3 +1,14 @@
+__all__ = (
+    "BloxlinkException",
+    "RobloxNotFound",
+    "RobloxAPIError",
+    "RobloxDown",
+    "UserNotVerified",
+    "Message",
+    "Error",
+)
+
+
 class BloxlinkException(Exception):
     """Base exception for Bloxlink."""
 
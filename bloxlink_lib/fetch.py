@@ -1,20 +1,24 @@
 import asyncio
 import logging
+import re
+from functools import lru_cache
 from enum import IntEnum
-from typing import Literal, Type, Union, Tuple, Any
+from typing import Awaitable, Callable, Literal, Type, Union, Tuple, Any
 from requests.utils import requote_uri
 import aiohttp
-from pydantic_core import to_json
+from yarl import URL
+from pydantic_core import from_json, to_json
 from bloxlink_lib.models.base import BaseModel
 from bloxlink_lib.utils import parse_into
 
 from .exceptions import RobloxAPIError, RobloxDown, RobloxNotFound
 from .config import CONFIG
 
-__all__ = ("StatusCodes", "fetch", "fetch_typed")
+__all__ = ("StatusCodes", "fetch", "fetch_typed", "close_session")
 
 
-session = None
+# one session per event loop, a session can't be used from another loop than the one it was created on
+_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
 
 
 class StatusCodes(IntEnum):
@@ -31,10 +35,155 @@ class StatusCodes(IntEnum):
     GATEWAY_TIMEOUT = 504
 
 
+_HOST_CONCURRENCY = 16  # max open connections, and so in-flight requests, per host
+
+# anything outside printable ASCII, or a % that doesn't start an escape
+_needs_requote = re.compile(r"[^\x21-\x7e]|%(?![0-9A-Fa-f]{2})").search
+
+_RETRY_STATUSES = frozenset({StatusCodes.TOO_MANY_REQUESTS, StatusCodes.SERVICE_UNAVAILABLE})
+# a 503 can come from a gateway after the request was already handled, so only methods that are safe to
+# repeat retry it. A 429 means the request was rejected, so it's retried for every method
+_RATE_LIMIT_STATUSES = frozenset({StatusCodes.TOO_MANY_REQUESTS})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_MAX_RETRIES = 2
+_RETRY_BACKOFF = 0.5  # seconds, doubled on every retry
+_MAX_RETRY_DELAY = 5  # never wait longer than this for a Retry-After header
+
+
 def _bytes_to_str_wrapper(data: Any) -> str:
     return to_json(data).decode("utf-8")
 
 
+@lru_cache(maxsize=16)
+def _timeout(total: float | None) -> aiohttp.ClientTimeout | None:
+    """Reuse the ClientTimeout for each distinct timeout value."""
+
+    return aiohttp.ClientTimeout(total=total) if total else None
+
+
+@lru_cache(maxsize=128)
+def _is_model(parse_as: Any) -> bool:
+    """Cached check for whether fetch can hand the raw body to pydantic for parse_as."""
+
+    return isinstance(parse_as, type) and issubclass(parse_as, BaseModel)
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Get the running loop's session, creating it on first use since it needs a running event loop.
+
+    There is no await between the check and the assignment, so concurrent callers can't create two sessions.
+    """
+
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=256,
+            limit_per_host=_HOST_CONCURRENCY,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+
+        session = _sessions[loop] = aiohttp.ClientSession(
+            connector=connector,
+            json_serialize=_bytes_to_str_wrapper,
+            timeout=_timeout(10),
+        )
+
+    return session
+
+
+async def close_session():
+    """Close the sessions of every event loop. Call this on shutdown to release pooled connections."""
+
+    loop = asyncio.get_running_loop()
+
+    while _sessions:
+        session_loop, session = _sessions.popitem()
+
+        if session_loop is not loop and session_loop.is_running():
+            # the loop runs in another thread, so the session is closed there
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), session_loop))
+            continue
+
+        try:
+            await session.close()
+        except RuntimeError:
+            # its loop is already closed, so there is nothing left to clean up on it
+            pass
+
+
+def _is_roblox_host(host: str | None) -> bool:
+    return host is not None and (host == "roblox.com" or host.endswith(".roblox.com"))
+
+
+async def _parse_json(response: aiohttp.ClientResponse) -> dict:
+    try:
+        return await response.json(loads=from_json)
+    except aiohttp.client_exceptions.ContentTypeError as exc:
+        logging.debug(f"{response.url} {await response.text()}")
+
+        raise RobloxAPIError() from exc
+
+
+_PARSERS: dict[str, Callable[[aiohttp.ClientResponse], Awaitable[Any]]] = {
+    "TEXT": lambda response: response.text(),
+    "JSON": _parse_json,
+    "BYTES": lambda response: response.read(),
+}
+
+
+async def _handle_response[T](
+    response: aiohttp.ClientResponse,
+    url: URL,
+    parse_as: Literal["JSON", "BYTES", "TEXT"] | BaseModel | Type[T],
+    raise_on_failure: bool,
+    validate: bool,
+):
+    if response.status != StatusCodes.OK and raise_on_failure:
+        if response.status == StatusCodes.SERVICE_UNAVAILABLE:
+            raise RobloxDown()
+
+        # Roblox APIs sometimes use 400 as not found
+        if response.status in (StatusCodes.BAD_REQUEST, StatusCodes.NOT_FOUND):
+            logging.debug(f"{url} not found: {await response.text()}")
+            raise RobloxNotFound()
+
+        logging.debug(f"{url} failed with status {response.status} and body {await response.text()}")
+        raise RobloxAPIError()
+
+    if parse_as:
+        handler = _PARSERS.get(parse_as) if isinstance(parse_as, str) else None
+
+        if handler:
+            return await handler(response), response
+
+        # pydantic-core parses and validates the raw body in one pass
+        if _is_model(parse_as):
+            if not validate:
+                return parse_as.model_construct(**await response.json(loads=from_json)), response
+
+            return parse_as.model_validate_json(await response.read()), response
+
+        return parse_into(await response.json(loads=from_json), parse_as), response
+
+    return response
+
+
+def _retry_delay(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying, from Retry-After if Roblox sent one, otherwise exponential backoff."""
+
+    retry_after = response.headers.get("Retry-After", "")
+
+    if retry_after.isdigit():
+        return min(int(retry_after), _MAX_RETRY_DELAY)
+
+    return _RETRY_BACKOFF * 2 ** attempt
+
+
 async def fetch[T](
     method: str,
     url: str,
@@ -45,10 +194,15 @@ async def fetch[T](
     parse_as: Literal["JSON", "BYTES", "TEXT"] | BaseModel | Type[T] = "JSON",
     raise_on_failure: bool = True,
     timeout: float = 10,
+    validate: bool = True,
 ) -> Union[Tuple[dict, aiohttp.ClientResponse], Tuple[str, aiohttp.ClientResponse], Tuple[bytes, aiohttp.ClientResponse], Tuple[T, aiohttp.ClientResponse], aiohttp.ClientResponse]:
     """Make a REST request with the ability to proxy.
 
     Only Roblox URLs are proxied, all other requests to other domains are sent as is.
+    Concurrent requests are capped per host by the session's connector, and 429 responses are retried with
+    backoff. 503 responses are only retried for idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE), so a
+    POST or PATCH isn't sent twice. The timeout applies to each attempt, so a request can take up to 3x the timeout plus the
+    backoff in the worst case, and a 503 is only raised as RobloxDown after about 1.5s of backoff.
 
     Args:
         method (str): The HTTP request method to use for this query.
@@ -59,7 +213,9 @@ async def fetch[T](
         parse_as (JSON | BYTES | TEXT | Type[T], optional): Set what the expected type to return should be.
             Defaults to JSON.
         raise_on_failure (bool, optional): Whether an exception be raised if the request fails. Defaults to True.
-        timeout (float, optional): How long should we wait for a request to succeed. Defaults to 10 seconds.
+        timeout (float, optional): How long should we wait for each attempt to succeed. Defaults to 10 seconds.
+        validate (bool, optional): Whether a BaseModel parse_as should be validated. Only skip this for
+            trusted payloads that already match the model. Defaults to True.
 
     Raises:
         RobloxAPIError:
@@ -73,76 +229,62 @@ async def fetch[T](
         Tuple[dict, ClientResponse] | Tuple[str, ClientResponse] | Tuple[bytes, ClientResponse] | ClientResponse:
         The requested data from the request, if any.
     """
-    global session  # pylint: disable=global-statement
-
     params = params or {}
     headers = headers or {}
 
-    if not session:
-        session = aiohttp.ClientSession(json_serialize=_bytes_to_str_wrapper)
-
-    url = requote_uri(url)
-
-    for k, v in dict(params).items():
-        if isinstance(v, bool):
-            params[k] = "true" if v else "false"
-        elif v is None:
-            del params[k]
-
-    try:
-        async with session.request(
-            method,
-            url,
-            json=body,
-            params=params,
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=timeout) if timeout else None,
-            proxy=CONFIG.PROXY_URL if CONFIG.PROXY_URL and "roblox.com" in url else None,
-        ) as response:
-            if response.status != StatusCodes.OK and raise_on_failure:
-                if response.status == StatusCodes.SERVICE_UNAVAILABLE:
-                    raise RobloxDown()
-
-                # Roblox APIs sometimes use 400 as not found
-                if response.status in (StatusCodes.BAD_REQUEST, StatusCodes.NOT_FOUND):
-                    logging.debug(f"{url} not found: {await response.text()}")
-                    raise RobloxNotFound()
-
-                logging.debug(f"{url} failed with status {response.status} and body {await response.text()}")
-                raise RobloxAPIError()
-
-            if parse_as:
-                if parse_as == "TEXT":
-                    return await response.text(), response
+    # serialize the body to bytes once, json= would round-trip it through str
+    data = None
 
-                if parse_as == "JSON":
-                    try:
-                        json_response = await response.json()
-                    except aiohttp.client_exceptions.ContentTypeError as exc:
-                        logging.debug(f"{url} {await response.text()}")
+    if body is not None:
+        data = to_json(body)
+        headers = {"Content-Type": "application/json", **headers}
 
-                        raise RobloxAPIError() from exc
+    # requote_uri is costly, so only run it when the URL actually needs quoting
+    if _needs_requote(url):
+        url = requote_uri(url)
 
-                    return json_response, response
+    url = URL(url)
 
-                if parse_as == "BYTES":
-                    return await response.read(), response
+    params = {
+        k: "true" if v is True else "false" if v is False else v
+        for k, v in params.items() if v is not None
+    }
 
-                return parse_into(await response.json(), parse_as), response
+    retry_statuses = _RETRY_STATUSES if method.upper() in _IDEMPOTENT_METHODS else _RATE_LIMIT_STATUSES
 
-            return response
+    try:
+        for attempt in range(_MAX_RETRIES + 1):
+            async with _get_session().request(
+                method,
+                url,
+                data=data,
+                params=params,
+                headers=headers,
+                timeout=_timeout(timeout),
+                proxy=CONFIG.PROXY_URL if CONFIG.PROXY_URL and _is_roblox_host(url.host) else None,
+            ) as response:
+                if response.status not in retry_statuses or attempt == _MAX_RETRIES:
+                    return await _handle_response(response, url, parse_as, raise_on_failure, validate)
+
+                delay = _retry_delay(response, attempt)
+
+            # the connection is released before sleeping, so other requests to this host can go through
+            logging.debug(f"{url} returned {response.status}, retrying in {delay}s")
+            await asyncio.sleep(delay)
 
     except asyncio.TimeoutError:
         logging.debug(f"URL {url} timed out")
         raise RobloxDown() from None
 
 
-async def fetch_typed[T](parse_as: Type[T], url: str, method="GET", **kwargs) -> Tuple[T, aiohttp.ClientResponse]:
+async def fetch_typed[T](parse_as: Type[T], url: str, *, method: str = "GET", **kwargs) -> Tuple[T, aiohttp.ClientResponse]:
     """Fetch data from a URL and parse it as a dataclass.
 
     Args:
-        url (str): The URL to send the request to.
         parse_as (Type[T]): The dataclass to parse the response as.
+        url (str): The URL to send the request to.
+        method (str, optional): The HTTP request method. Keyword-only. Defaults to GET.
+        **kwargs: Passed to fetch().
 
     Returns:
         T: The dataclass instance of the response.
@@ -1,13 +1,17 @@
+from typing import Literal
 from pydantic import Field
 from ..fetch import fetch_typed
-from .base import BaseModel, get_entity
+from .base import FrozenResponseModel, get_entity, register_entity
 from .base_assets import RobloxBaseAsset
 
 
+__all__ = ("ASSET_API", "RobloxAssetResponse", "RobloxAsset", "get_catalog_asset")
+
+
 ASSET_API = "https://economy.roblox.com/v2/assets"
 
 
-class RobloxAssetResponse(BaseModel):
+class RobloxAssetResponse(FrozenResponseModel):
     """Representation of the response from the Roblox Asset API."""
 
     id: int = Field(alias="AssetId")
@@ -15,10 +19,11 @@ class RobloxAssetResponse(BaseModel):
     description: str = Field(alias="Description")
 
 
+@register_entity("asset")
 class RobloxAsset(RobloxBaseAsset):
     """Representation of a catalog asset on Roblox."""
 
-    type: str = "asset"
+    type: Literal["asset"] = "asset"
 
     async def sync(self):
         """Load catalog asset data from Roblox"""
@@ -26,7 +31,7 @@ class RobloxAsset(RobloxBaseAsset):
         if self.synced:
             return
 
-        asset_data, _ = await fetch_typed(RobloxAssetResponse, f"{ASSET_API}/{self.id}/details")
+        asset_data, _ = await fetch_typed(RobloxAssetResponse, f"{ASSET_API}/{self.id}/details", validate=False)
 
         self.name = asset_data.name
         self.description = asset_data.description
@@ -1,12 +1,16 @@
+from typing import Literal
 from ..fetch import fetch_typed
-from .base import BaseModel, get_entity
+from .base import FrozenResponseModel, get_entity, register_entity
 from .base_assets import RobloxBaseAsset
 
 
+__all__ = ("BADGE_API", "RobloxBadgeResponse", "RobloxBadge", "get_badge")
+
+
 BADGE_API = "https://badges.roblox.com/v1/badges"
 
 
-class RobloxBadgeResponse(BaseModel):
+class RobloxBadgeResponse(FrozenResponseModel):
     """Representation of the response from the Roblox badge API."""
 
     id: int
@@ -14,10 +18,11 @@ class RobloxBadgeResponse(BaseModel):
     description: str | None
 
 
+@register_entity("badge")
 class RobloxBadge(RobloxBaseAsset):
     """Representation of a Badge on Roblox."""
 
-    type: str = "badge"
+    type: Literal["badge"] = "badge"
 
     async def sync(self):
         """Load badge data from Roblox"""
@@ -25,7 +30,7 @@ class RobloxBadge(RobloxBaseAsset):
         if self.synced:
             return
 
-        badge_data, _ = await fetch_typed(RobloxBadgeResponse, f"{BADGE_API}/{self.id}")
+        badge_data, _ = await fetch_typed(RobloxBadgeResponse, f"{BADGE_API}/{self.id}", validate=False)
 
         self.name = badge_data.name
         self.description = badge_data.description
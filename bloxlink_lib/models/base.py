@@ -1,12 +1,39 @@
-from pydantic import BaseModel, PrivateAttr, field_validator
-from typing import Callable, Iterable, Type, Any,  Literal, Annotated, Tuple, Sequence, Self
+import asyncio
+from pydantic import BaseModel, GetCoreSchemaHandler
+from pydantic_core import core_schema
+from typing import Callable, ClassVar, Iterable, Type, Any,  Literal, Annotated, Tuple, Self
 from abc import ABC, abstractmethod
-from pydantic import BaseModel as PydanticBaseModel, BeforeValidator, WithJsonSchema, ConfigDict, Field, ConfigDict, SkipValidation
+from functools import cache, partial
+from operator import methodcaller
+from itertools import chain
+from cachetools import TTLCache
+from pydantic import BaseModel as PydanticBaseModel, WithJsonSchema, ConfigDict
 from pydantic.fields import FieldInfo
 from generics import get_filled_type
 
-Snowflake = Annotated[int, BeforeValidator(
-    int), WithJsonSchema({"type": 'int'})]
+
+__all__ = (
+    "Snowflake",
+    "UNDEFINED",
+    "BaseModelArbitraryTypes",
+    "BaseModel",
+    "BaseModelStrict",
+    "FrozenResponseModel",
+    "RobloxEntity",
+    "BloxlinkEntity",
+    "CoerciveSet",
+    "SnowflakeSet",
+    "register_entity",
+    "create_entity",
+    "create_entity_validated",
+    "get_entity",
+    "invalidate_entity",
+    "get_entities",
+)
+
+
+# pydantic-core already coerces strings and int subclasses (hikari Snowflakes, permission flags) in lax mode
+Snowflake = Annotated[int, WithJsonSchema({"type": "integer"})]
 
 
 class UNDEFINED:
@@ -17,32 +44,35 @@ class UNDEFINED:
 
 
 class BaseModelArbitraryTypes(PydanticBaseModel):
-    """Base model with arbitrary types allowed."""
+    """Base model with arbitrary types allowed. Like BaseModel, attribute assignment is not validated."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True,
-                              populate_by_name=True, validate_assignment=True)
+                              populate_by_name=True, validate_assignment=False)
 
 
 class BaseModel(PydanticBaseModel):
-    """Base model with a set configuration."""
+    """Base model with a set configuration. Attribute assignment is not validated, use BaseModelStrict for that."""
 
-    model_config = ConfigDict(populate_by_name=True, validate_assignment=True)
+    model_config = ConfigDict(populate_by_name=True, validate_assignment=False)
     _generic_type_value: Any = None
 
-    @classmethod
-    def model_fields_index(cls: Type[PydanticBaseModel | BaseModelArbitraryTypes]) -> list[Tuple[str, FieldInfo]]:
-        """Returns a list of the model's fields with the name as a tuple.
+    _fields_index: ClassVar[tuple[Tuple[str, FieldInfo], ...]] = ()
 
-        Useful if the field index is necessary.
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        # model_fields is only populated here, not in __init_subclass__
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._fields_index = tuple(cls.model_fields.items())
 
-        """
+    @classmethod
+    def model_fields_index(cls: Type[PydanticBaseModel | BaseModelArbitraryTypes]) -> tuple[Tuple[str, FieldInfo], ...]:
+        """Returns the model's fields with the name as a tuple.
 
-        fields_with_names: list[Tuple[str, FieldInfo]] = []
+        Useful if the field index is necessary. Computed once per class.
 
-        for field_name, field in cls.model_fields.items():
-            fields_with_names.append((field_name, field))
+        """
 
-        return fields_with_names
+        return cls._fields_index
 
     def get_type(self) -> Any:
         if self._generic_type_value:
@@ -53,6 +83,18 @@ class BaseModel(PydanticBaseModel):
         return self._generic_type_value
 
 
+class BaseModelStrict(BaseModel):
+    """Base model that validates attribute assignment, for models that are mutated with untrusted data."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class FrozenResponseModel(BaseModel):
+    """Base model for API responses that are only read after they're parsed."""
+
+    model_config = ConfigDict(populate_by_name=True, validate_assignment=False, frozen=True)
+
+
 class RobloxEntity(BaseModel, ABC):
     """Representation of an entity on Roblox.
 
@@ -75,13 +117,17 @@ class RobloxEntity(BaseModel, ABC):
         raise NotImplementedError()
 
     def __str__(self) -> str:
-        name = f"**{self.name}**" if self.name else "*(Unknown Roblox Entity)*"
-        return f"{name} ({self.id})"
+        # one format per call, no intermediate string for the name
+        name = self.name
+        return f"**{name}** ({self.id})" if name else f"*(Unknown Roblox Entity)* ({self.id})"
 
 
 class BloxlinkEntity(RobloxEntity):
     """Entity for Bloxlink-specific operations."""
 
+    # a fixed value object, there is nothing to sync into it
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["verified", "unverified"]
     id: None = None
 
@@ -92,135 +138,309 @@ class BloxlinkEntity(RobloxEntity):
         return "Verified Users" if self.type == "verified" else "Unverified Users"
 
 
-class CoerciveSet[T: Callable](BaseModel):
+def _coerce_to[T](target_type: Type[T], item: Any) -> T:
+    # exact type check, isinstance walks the MRO
+    return item if type(item) is target_type else target_type(item)
+
+
+def _coerce_int(item: Any) -> int:
+    # SnowflakeSet's hot path, skips the partial and the int() call for items that are already ints
+    return item if type(item) is int else int(item)
+
+
+def _all_ints(items: Iterable[Any]) -> bool:
+    # map(type, ...) stays in C, about twice as fast as running every item through _coerce_int
+    return {*map(type, items)} == {int}
+
+
+class CoerciveSet[T: Callable](set[T]):
     """A set that coerces the children into another type."""
 
-    root: Annotated[Sequence[T], SkipValidation]
+    __slots__ = ()
 
-    @field_validator("root", mode="before", check_fields=False)
-    @classmethod
-    def transform_root(cls: Type[Self], old_root: Iterable[T]) -> Sequence[T]:
-        return list(old_root)
+    # resolved once per parametrized class, e.g. CoerciveSet[int], so coercing an item is a single call
+    _target_type: ClassVar[Type[T] | None] = None
+    _coerce_fn: ClassVar[Callable[[Any], T] | None] = None
+    # the class that was parametrized, only set on the classes made by __class_getitem__
+    _origin: ClassVar[Type["CoerciveSet"] | None] = None
 
-    _data: set[T] = PrivateAttr(default_factory=set)
+    def __class_getitem__(cls, item: Any):
+        # type variables (e.g. in annotations) still produce a plain generic alias
+        if not isinstance(item, type):
+            return super().__class_getitem__(item)
+
+        return _parametrize_set(cls, item)
 
     def __init__(self, root: Iterable[T] = None):
-        super().__init__(root=root or [])
+        super().__init__()
 
-    def model_post_init(self, __context: Any) -> None:
-        self._data = set(self._coerce(x) for x in self.root)
+        if root:
+            self._apply(self, set.update, (root,))
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # accepts a list, or the {"root": [...]} shape these sets were stored in as pydantic models, and is
+        # serialized back into that shape. instances of cls are passed through as is, rebuilding them would drop
+        # e.g. SnowflakeSet.type
+        from_data = core_schema.no_info_after_validator_function(
+            cls._from_stored,
+            core_schema.union_schema([core_schema.list_schema(), core_schema.dict_schema(core_schema.str_schema())]),
+        )
+
+        return core_schema.json_or_python_schema(
+            json_schema=from_data,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_data]),
+            serialization=core_schema.plain_serializer_function_ser_schema(methodcaller("_stored")),
+        )
+
+    @classmethod
+    def _from_stored(cls, data: list | dict) -> Self:
+        """Build a set from a list of items, or from its stored {"root": [...]} shape."""
+
+        return cls(data.get("root")) if isinstance(data, dict) else cls(data)
+
+    def _stored(self) -> dict[str, Any]:
+        """The shape this set is stored and serialized in, the same as when it was a pydantic model."""
+
+        return {"root": list(self)}
+
+    @classmethod
+    def _from_validated(cls, data: Iterable[T], **attrs: Any) -> Self:
+        """Wrap already coerced items without coercing them again."""
+
+        new_set = cls.__new__(cls)
+        set.__init__(new_set, data)
+
+        for name, value in attrs.items():
+            setattr(new_set, name, value)
+
+        return new_set
+
+    def _derived(self, data: set[T]) -> Self:
+        """Wrap the result of a set operation on this set."""
+
+        return self._from_validated(data)
+
+    def __reduce__(self):
+        # classes made by __class_getitem__ can't be looked up by name, so they're rebuilt from their origin
+        cls = self.__class__
+        origin = cls.__dict__.get("_origin")
+
+        if origin is not None:
+            return _restore_set, (origin, cls._target_type, list(self))
+
+        return cls, (list(self),)
 
     def _coerce(self, item: Any) -> T:
-        target_type = self.get_type()
+        try:
+            return self._coerce_fn(item)
+        except (TypeError, ValueError):
+            raise TypeError(f"Cannot coerce {item} to {self._target_type}")
+
+    def _coerce_all(self, iterable: Iterable[Any]) -> set[T]:
+        # items of a set with the same target type are already coerced, the result is only ever read
+        if isinstance(iterable, CoerciveSet) and iterable._target_type is self._target_type:
+            return iterable
+
+        try:
+            return set(map(self._coerce_fn, iterable))
+        except (TypeError, ValueError):
+            raise TypeError(f"Cannot coerce items of {iterable} to {self._target_type}")
+
+    def _coerced(self, iterable: Iterable[Any]) -> Iterable[T]:
+        """Lazily coerce an iterable, for set methods that consume it in one pass."""
+
+        if isinstance(iterable, CoerciveSet) and iterable._target_type is self._target_type:
+            return iterable
+
+        return map(self._coerce_fn, iterable)
+
+    def _apply(self, target: set[T], method: Callable[..., None], s: tuple[Iterable[Any], ...]) -> None:
+        """Run an in-place set method on target, coercing the inputs as the method consumes them."""
 
-        if isinstance(item, target_type):
-            return item
         try:
-            return target_type(item)
+            method(target, *map(self._coerced, s))
         except (TypeError, ValueError):
-            raise TypeError(f"Cannot coerce {item} to {target_type}")
+            raise TypeError(f"Cannot coerce items of {s} to {self._target_type}")
+
+    # items that already have the target type skip _coerce
 
     def __contains__(self, item):
-        return self._data.__contains__(self._coerce(item))
+        return super().__contains__(item if type(item) is self._target_type else self._coerce(item))
 
     def add(self, item):
-        self._data.add(self._coerce(item))
+        super().add(item if type(item) is self._target_type else self._coerce(item))
 
     def remove(self, item):
-        self._data.remove(self._coerce(item))
+        super().remove(item if type(item) is self._target_type else self._coerce(item))
 
     def discard(self, item):
-        self._data.discard(self._coerce(item))
+        super().discard(item if type(item) is self._target_type else self._coerce(item))
+
+    # the set operations copy this set once and update the copy in place,
+    # so neither the coerced inputs nor the result are materialized twice
 
     def update(self, *s: Iterable[T]):
-        for iterable in s:
-            for item in iterable:
-                self._data.add(self._coerce(item))
+        self._apply(self, set.update, s)
 
-    def intersection(self, *s: Iterable[T]) -> 'CoerciveSet[T]':
-        result = self._data.intersection(self._coerce(x) for i in s for x in i)
-        return self.__class__(root=result)
+    def intersection(self, *s: Iterable[T]) -> Self:
+        result = self._derived(self)
+        self._apply(result, set.intersection_update, s)
+        return result
 
-    def difference(self, *s: Iterable[T]) -> 'CoerciveSet[T]':
-        result = self._data.difference(self._coerce(x) for i in s for x in i)
-        return self.__class__(root=result)
+    def difference(self, *s: Iterable[T]) -> Self:
+        result = self._derived(self)
+        self._apply(result, set.difference_update, s)
+        return result
 
-    def symmetric_difference(self, *s: Iterable[T]) -> 'CoerciveSet[T]':
-        result = self._data.symmetric_difference(
-            self._coerce(x) for i in s for x in i)
-        return self.__class__(root=result)
+    def symmetric_difference(self, *s: Iterable[T]) -> Self:
+        result = self._derived(self)
+        # set.symmetric_difference_update takes exactly one iterable
+        self._apply(result, set.symmetric_difference_update, s if len(s) == 1 else (chain.from_iterable(s),))
+        return result
 
-    def union(self, *s: Iterable[T]) -> 'CoerciveSet[T]':
-        result = self._data.union(self._coerce(x)
-                                  for iterable in s for x in iterable)
-        return self.__class__(root=result)
+    def union(self, *s: Iterable[T]) -> Self:
+        result = self._derived(self)
+        self._apply(result, set.update, s)
+        return result
 
     def contains_all(self, iterable: Iterable[T]) -> bool:
-        return all(self._coerce(x) in self._data for x in iterable)
-
-    def contains(self, *items: Sequence[T]) -> bool:
-        return all(self._coerce(x) in self._data for i in items for x in i)
-
-    def __iter__(self):
-        return iter(self._data)
+        return self._coerce_all(iterable) <= self
 
-    def __len__(self) -> int:
-        return len(self._data)
+    def contains(self, *items: Iterable[T]) -> bool:
+        return all(self._coerce_all(i) <= self for i in items)
 
     def __eq__(self, other) -> bool:
         return self.contains(x for x in other) if isinstance(other, CoerciveSet) else False
 
+    __hash__ = None
+
     def __str__(self) -> str:
-        return ", ".join(str(i) for i in self)
+        return ", ".join(map(str, self))
 
     def __repr__(self) -> str:
         return self.__str__()
 
 
+@cache
+def _parametrize_set[T](cls: Type[CoerciveSet], target_type: Type[T]) -> Type[CoerciveSet[T]]:
+    """Create the concrete subclass for CoerciveSet[target_type], once per type."""
+
+    return type(f"{cls.__name__}[{target_type.__name__}]", (cls,), {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "_target_type": target_type,
+        "_origin": cls,
+        # staticmethod so a plain function isn't bound as a method
+        "_coerce_fn": staticmethod(_coerce_int) if target_type is int else partial(_coerce_to, target_type),
+    })
+
+
+def _restore_set[T](origin: Type[CoerciveSet], target_type: Type[T], items: list[T]) -> CoerciveSet[T]:
+    """Unpickle a set of a class made by CoerciveSet.__class_getitem__."""
+
+    return _parametrize_set(origin, target_type)._from_validated(items)
+
+
+# SnowflakeSet.type -> how an ID without a str_reference entry is rendered
+_MENTION_FORMATS: dict[str, str] = {
+    "role": "<@&{}>",
+    "user": "<@{}>",
+}
+
+
 class SnowflakeSet(CoerciveSet[int]):
     """A set of Snowflakes."""
 
-    root: Sequence[int] = Field(kw_only=False)
-    type: Literal["role", "user"] | None = Field(default=None)
-    str_reference: dict = Field(default_factory=dict)
+    __slots__ = ("type", "str_reference")
 
     def __init__(self, root: Iterable[int] = None, type: Literal["role", "user"] = None, str_reference: dict = None):
-        super().__init__(root=root or [])
+        # collections that are already all ints (e.g. from the database) are copied without coercing,
+        # iterators are skipped since checking them would consume them
+        if root.__class__ in (list, tuple, set, frozenset) and _all_ints(root):
+            super().__init__()
+            set.update(self, root)
+        else:
+            super().__init__(root)
+
         self.type = type
         self.str_reference = str_reference or {}
 
+    def _coerce(self, item: Any) -> int:
+        # objects with an ID (roles, members, entities) are stored by their ID
+        return super()._coerce(getattr(item, "id", None) or item)
+
+    # ints skip _coerce entirely, they're the common case
+
+    def __contains__(self, item):
+        return set.__contains__(self, item if type(item) is int else self._coerce(item))
+
     def add(self, item):
         """Add an item to the set. If the item contains an ID, it will be parsed into an integer. Otherwise, it will be added as an int."""
-        if getattr(item, "id", None):
-            return super().add(item.id)
-        return super().add(item)
+        set.add(self, item if type(item) is int else self._coerce(item))
 
-    def intersection(self, *s: Iterable[int]) -> 'SnowflakeSet':
-        result = super().intersection(*s)
-        return SnowflakeSet(root=result._data, type=self.type, str_reference=self.str_reference)
+    def remove(self, item):
+        set.remove(self, item if type(item) is int else self._coerce(item))
 
-    def difference(self, *s: Iterable[int]) -> 'SnowflakeSet':
-        result = super().difference(*s)
-        return SnowflakeSet(root=result._data, type=self.type, str_reference=self.str_reference)
+    def discard(self, item):
+        set.discard(self, item if type(item) is int else self._coerce(item))
+
+    def _derived(self, data: set[int]) -> Self:
+        return self._from_validated(data, type=self.type, str_reference=self.str_reference)
 
-    def symmetric_difference(self, *s: Iterable[int]) -> 'SnowflakeSet':
-        result = super().symmetric_difference(*s)
-        return SnowflakeSet(root=result._data, type=self.type, str_reference=self.str_reference)
+    def __reduce__(self):
+        return self.__class__, (list(self), self.type, self.str_reference)
+
+    @classmethod
+    def _from_stored(cls, data: list | dict) -> Self:
+        if isinstance(data, dict):
+            return cls(data.get("root"), data.get("type"), data.get("str_reference"))
 
-    def union(self, *s: Iterable[int]) -> 'SnowflakeSet':
-        result = super().union(*s)
-        return SnowflakeSet(root=result._data, type=self.type, str_reference=self.str_reference)
+        return cls(data)
+
+    def _stored(self) -> dict[str, Any]:
+        return {"root": list(self), "type": self.type, "str_reference": self.str_reference}
 
     def __str__(self):
-        match self.type:
-            case "role":
-                return ", ".join(str(self.str_reference.get(i) or f"<@&{i}>") for i in self)
-            case "user":
-                return ", ".join(str(self.str_reference.get(i) or f"<@{i}>") for i in self)
-        return ", ".join(str(self.str_reference.get(i) or i) for i in self)
+        mention = _MENTION_FORMATS.get(self.type, "{}").format
+
+        # usually empty, no lookups needed then
+        if not self.str_reference:
+            return ", ".join(map(mention, self))
+
+        ref_get = self.str_reference.get
+
+        # str_reference values can be any object, join() gets a list so it doesn't drain a generator first
+        return ", ".join([str(ref_get(i) or mention(i)) for i in self])
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self._data})"
+        return f"{self.__class__.__name__}({set(self)})"
+
+
+# category -> factory taking the entity ID
+_ENTITY_FACTORIES: dict[str, Callable[[int], RobloxEntity]] = {
+    "verified": lambda _entity_id: BloxlinkEntity.model_construct(type="verified"),
+    "unverified": lambda _entity_id: BloxlinkEntity.model_construct(type="unverified"),
+}
+
+
+# synced entities by (category, ID), deep-copied out on every get_entity() call
+_entity_cache: TTLCache[tuple[str, int], RobloxEntity] = TTLCache(maxsize=10_000, ttl=3600)
+_entity_syncs: dict[tuple[str, int], asyncio.Task[RobloxEntity]] = {}
+
+
+def register_entity[E: RobloxEntity](category: str) -> Callable[[Type[E]], Type[E]]:
+    """Class decorator that lets create_entity() build this entity for a category.
+
+    Args:
+        category (str): The category name, such as "badge".
+    """
+
+    def decorator(entity_type: Type[E]) -> Type[E]:
+        _ENTITY_FACTORIES[category] = lambda entity_id: entity_type.model_construct(id=entity_id)
+        return entity_type
+
+    return decorator
 
 
 def create_entity(
@@ -228,6 +448,9 @@ def create_entity(
 ) -> RobloxEntity | None:
     """Create a respective Roblox entity from a category and ID.
 
+    The entity is built without validation, so entity_id must already be an int.
+    Use create_entity_validated() for untrusted input.
+
     Args:
         category (str): Type of Roblox entity to make. Subset from asset, badge, group, gamepass.
         entity_id (int): ID of the entity on Roblox.
@@ -236,31 +459,40 @@ def create_entity(
         RobloxEntity: The respective RobloxEntity implementer, unsynced, or None if the category is invalid.
     """
 
-    match category:
-        case "asset":
-            from bloxlink_lib.models import assets  # pylint: disable=import-outside-toplevel
+    factory = _ENTITY_FACTORIES.get(category)
+
+    return factory(entity_id) if factory else None
+
 
-            return assets.RobloxAsset(id=entity_id)
+def create_entity_validated(
+    category: Literal["asset", "badge", "gamepass", "group", "verified", "unverified"] | str, entity_id: int | str
+) -> RobloxEntity | None:
+    """Like create_entity(), but validates the entity's fields.
 
-        case "badge":
-            from bloxlink_lib.models import badges  # pylint: disable=import-outside-toplevel
+    Args:
+        category (str): Type of Roblox entity to make. Subset from asset, badge, group, gamepass.
+        entity_id (int | str): ID of the entity on Roblox.
 
-            return badges.RobloxBadge(id=entity_id)
+    Returns:
+        RobloxEntity: The respective RobloxEntity implementer, unsynced, or None if the category is invalid.
+    """
 
-        case "gamepass":
-            from bloxlink_lib.models import gamepasses  # pylint: disable=import-outside-toplevel
+    entity = create_entity(category, entity_id)
 
-            return gamepasses.RobloxGamepass(id=entity_id)
+    if entity is None:
+        return None
 
-        case "group":
-            from bloxlink_lib.models import groups  # pylint: disable=import-outside-toplevel
+    return entity.model_validate({field_name: getattr(entity, field_name) for field_name in entity.model_fields_set})
 
-            return groups.RobloxGroup(id=entity_id)
 
-        case "verified" | "unverified":
-            return BloxlinkEntity(type=category)
+async def _sync_entity(category: str, entity_id: int) -> RobloxEntity:
+    entity = create_entity(category, entity_id)
 
-    return None
+    await entity.sync()
+
+    _entity_cache[(category, entity_id)] = entity
+
+    return entity
 
 
 async def get_entity(
@@ -273,11 +505,50 @@ async def get_entity(
         entity_id (int): ID of the entity on Roblox.
 
     Returns:
-        RobloxEntity: The respective RobloxEntity implementer, synced.
+        RobloxEntity: The respective RobloxEntity implementer, synced. Synced entities are cached for an hour,
+            each call gets its own deep copy.
     """
 
-    entity = create_entity(category, int(entity_id))
+    # most callers already pass an int
+    entity_id = entity_id if type(entity_id) is int else int(entity_id)
+    key = (category, entity_id)
+    entity = _entity_cache.get(key)
 
-    await entity.sync()
+    if entity is None:
+        # concurrent calls for the same entity share one sync
+        task = _entity_syncs.get(key)
 
-    return entity
+        if task is None:
+            task = _entity_syncs[key] = asyncio.create_task(_sync_entity(category, entity_id))
+            task.add_done_callback(lambda _: _entity_syncs.pop(key, None))
+
+        entity = await asyncio.shield(task)
+
+    return entity.model_copy(deep=True)
+
+
+def invalidate_entity(category: Literal["asset", "badge", "gamepass", "group"] | str, entity_id: int) -> None:
+    """Drop a synced entity from the cache, so the next get_entity() call syncs it again.
+
+    Args:
+        category (str): Type of Roblox entity. Subset from asset, badge, group, gamepass.
+        entity_id (int): ID of the entity on Roblox.
+    """
+
+    _entity_cache.pop((category, int(entity_id)), None)
+
+
+async def get_entities(entities: Iterable[tuple[str, int]]) -> list[RobloxEntity]:
+    """Get and sync many Roblox entities concurrently. Prefer this over awaiting get_entity() in a loop.
+
+    Requests are still capped per host by fetch().
+
+    Args:
+        entities (Iterable[tuple[str, int]]): (category, ID) pairs, see get_entity().
+
+    Returns:
+        list[RobloxEntity]: The synced entities, in the same order as the pairs.
+    """
+
+    # gather() re-raises the first failure as is (e.g. RobloxNotFound), a TaskGroup would wrap it in an ExceptionGroup
+    return list(await asyncio.gather(*(get_entity(category, entity_id) for category, entity_id in entities)))
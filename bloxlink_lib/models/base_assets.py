@@ -8,6 +8,9 @@ from .base import RobloxEntity
 # ASSET_API = "https://economy.roblox.com/v2/assets"
 
 
+__all__ = ("RobloxBaseAsset",)
+
+
 class RobloxBaseAsset(RobloxEntity):
     """
     Representation of a Base Asset on Roblox.
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import math
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict, Annotated, Self, Type
 
 from pydantic import Field, ValidationError
@@ -20,11 +22,35 @@ if TYPE_CHECKING:
     from .users import MemberSerializable, RobloxUser
 
 
+__all__ = (
+    "POP_OLD_BINDS",
+    "SAVE_NEW_BINDS",
+    "VALID_BIND_TYPES",
+    "ARBITRARY_GROUP_TEMPLATE",
+    "NICKNAME_TEMPLATE_REGEX",
+    "GroupBindDataDict",
+    "BindCriteriaDict",
+    "BindDataDict",
+    "GroupBindData",
+    "BindCriteria",
+    "BindData",
+    "GuildBind",
+    "build_binds_desc",
+    "count_binds",
+    "check_for_verified_roles",
+    "get_binds",
+    "get_nickname_template",
+    "parse_template",
+    "migrate_old_binds_to_v4",
+)
+
+
 POP_OLD_BINDS: bool = False  # remove old binds from the database
 SAVE_NEW_BINDS: bool = False  # save new binds to the database
 
 VALID_BIND_TYPES = Literal["group", "asset",
                            "badge", "gamepass", "verified", "unverified"]
+# not used by parse_template anymore, kept for callers outside the package
 ARBITRARY_GROUP_TEMPLATE = re.compile(r"\{group-rank-(.*?)\}")
 NICKNAME_TEMPLATE_REGEX = re.compile(r"\{(.*?)\}")
 
@@ -125,21 +151,26 @@ class GuildBind(BaseModel):
         exclude=True, default=None)  # highest role in the guild
 
     def model_post_init(self, __context):
-        self.entity = self.entity or create_entity(
-            self.criteria.type, self.criteria.id)
-        self.type = self.criteria.type
+        # plain assignments like sync() uses, validate_assignment is off so they don't validate again
+        criteria = self.criteria
+
+        self.entity = self.entity or create_entity(criteria.type, criteria.id)
+        self.type = criteria.type
 
-        if self.type == "group":
-            self.subtype = "full_group" if self.criteria.group.dynamicRoles else "role_bind"
+        if criteria.type == "group":
+            self.subtype = "full_group" if criteria.group.dynamicRoles else "role_bind"
 
     @classmethod
     def from_V3(cls: Type[Self], guild_data: GuildData | dict):
         """Convert V3 binds to V4 binds."""
 
-        whole_group_binds = getattr(
-            guild_data, "groupIDs", guild_data.get("groupIDs", {}))
-        role_binds = getattr(guild_data, "roleBinds",
-                             guild_data.get("roleBinds", {}))
+        # GuildData has no .get(), and leaves both fields as None when they aren't stored
+        if isinstance(guild_data, dict):
+            whole_group_binds = guild_data.get("groupIDs") or {}
+            role_binds = guild_data.get("roleBinds") or {}
+        else:
+            whole_group_binds = guild_data.groupIDs or {}
+            role_binds = guild_data.roleBinds or {}
 
         converted_binds: list[Self] = []
 
@@ -223,15 +254,14 @@ class GuildBind(BaseModel):
     def calculate_highest_role(self, guild_roles: dict[str, RoleSerializable]) -> None:
         """Calculate the highest role in the guild for this bind."""
 
-        if self.roles and not self.highest_role:
-            filtered_binds = filter(
-                lambda r: str(
-                    r.id) in self.roles and self.nickname, guild_roles.values()
-            )
+        if not self.nickname or not self.roles or self.highest_role:
+            return
 
-            if list(filtered_binds):
-                self.highest_role = max(
-                    filtered_binds, key=lambda r: r.position)
+        bind_role_ids = set(self.roles)
+        bind_roles = [r for r in guild_roles.values() if str(r.id) in bind_role_ids]
+
+        if bind_roles:
+            self.highest_role = max(bind_roles, key=lambda r: r.position)
 
     async def satisfies_for(
         self,
@@ -251,8 +281,8 @@ class GuildBind(BaseModel):
 
             # user is unverified, so remove Verified role
             if self.criteria.type == "verified":
-                for role_id in filter(lambda r: int(r) in member.role_ids, self.roles):
-                    ineligible_roles.add(role_id)
+                member_role_ids = set(member.role_ids)
+                ineligible_roles.update([role_id for role_id in self.roles if int(role_id) in member_role_ids])
 
             return False, additional_roles, missing_roles, ineligible_roles
 
@@ -270,14 +300,18 @@ class GuildBind(BaseModel):
 
                 # check if the user has any group roleset roles they shouldn't have
                 if self.criteria.group.dynamicRoles:
+                    # index the member's roles by name once instead of comparing every roleset with every role
+                    member_role_ids_by_name: dict[str, list[int]] = {}
+
+                    for role_id in member.role_ids:
+                        if role_id in guild_roles:
+                            member_role_ids_by_name.setdefault(guild_roles[role_id].name, []).append(role_id)
+
+                    user_roleset_str = str(user_roleset)
+
                     for roleset in group.rolesets.values():
-                        for role_id in member.role_ids:
-                            if (
-                                role_id in guild_roles
-                                and guild_roles[role_id].name == roleset.name
-                                and str(roleset) != str(user_roleset)
-                            ):
-                                ineligible_roles.add(role_id)
+                        if roleset.name in member_role_ids_by_name and str(roleset) != user_roleset_str:
+                            ineligible_roles.update(member_role_ids_by_name[roleset.name])
 
                 if self.criteria.id in roblox_user.groups:
                     # full group bind. check for a matching roleset
@@ -481,9 +515,8 @@ async def build_binds_desc(
 
     guild_binds = await get_binds(guild_id, category=bind_type, bind_id=bind_id)
 
-    # sync the first 5 binds
-    for bind in guild_binds[:5]:
-        await bind.entity.sync()
+    # sync the first 5 binds concurrently. gather() re-raises the first failure as is (e.g. RobloxNotFound)
+    await asyncio.gather(*(bind.entity.sync() for bind in guild_binds[:5] if bind.entity))
 
     bind_strings = [str(bind) for bind in guild_binds[:5]]
     output = "\n".join(bind_strings)
@@ -622,6 +655,29 @@ async def get_nickname_template(guild_id, potential_binds: list[GuildBind], robl
     return nickname_template, highest_priority_bind
 
 
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> tuple[tuple[tuple[str, str, str | None, str], ...], str]:
+    """Split a nickname template into its tokens once, so rendering it per member doesn't rescan it.
+
+    Returns:
+        tuple: (literal before the token, token, function, value) for each token, and the literal after the last token.
+    """
+
+    parts: list[tuple[str, str, str | None, str]] = []
+    position = 0
+
+    for match in NICKNAME_TEMPLATE_REGEX.finditer(template):
+        outer_nick = match.group(1)
+        nick_data = outer_nick.split(":")
+        nick_fn = nick_data[0] if len(nick_data) > 1 else None
+        nick_value = nick_data[1] if len(nick_data) > 1 else nick_data[0]
+
+        parts.append((template[position:match.start()], outer_nick, nick_fn, nick_value))
+        position = match.end()
+
+    return tuple(parts), template[position:]
+
+
 async def parse_template(
     guild_id: int,
     guild_name: str,
@@ -692,39 +748,33 @@ async def parse_template(
             else:
                 group_roleset_name = "Guest"
 
-            # parse {group-rank-<group_id>} in the nickname template
-            for group_id in ARBITRARY_GROUP_TEMPLATE.findall(template):
-                group = roblox_user.groups.get(group_id)
-                group_role_from_group = group.role.name if group else "Guest"
-
-                template = template.replace(
-                    "{group-rank-" + group_id + "}", group_role_from_group)
-
     # parse the nickname template
-    for outer_nick in NICKNAME_TEMPLATE_REGEX.findall(template):
-        nick_data = outer_nick.split(":")
-        nick_fn: str | None = nick_data[0] if len(nick_data) > 1 else None
-        nick_value: str = nick_data[1] if len(nick_data) > 1 else nick_data[0]
+    template_parts, template_tail = _compile_template(template)
+    nickname_parts: list[str] = []
+
+    for literal, outer_nick, nick_fn, nick_value in template_parts:
+        nickname_parts.append(literal)
 
         # nick_fn = capA
         # nick_value = roblox-name
 
-        if roblox_user:
-            match nick_value:
-                case "roblox-name":
-                    nick_value = roblox_user.username
-                case "display-name":
-                    nick_value = roblox_user.display_name
-                case "smart-name":
-                    nick_value = smart_name
-                case "roblox-id":
-                    nick_value = str(roblox_user.id)
-                case "roblox-age":
-                    nick_value = str(roblox_user.age_days)
-                case "group-rank":
-                    nick_value = group_roleset_name
+        if nick_fn and nick_fn not in ("allC", "allL"):
+            nickname_parts.append(outer_nick)  # remove {} only
+            continue
 
         match nick_value:
+            case "roblox-name" if roblox_user:
+                nick_value = roblox_user.username
+            case "display-name" if roblox_user:
+                nick_value = roblox_user.display_name
+            case "smart-name":
+                nick_value = smart_name
+            case "roblox-id" if roblox_user:
+                nick_value = str(roblox_user.id)
+            case "roblox-age" if roblox_user:
+                nick_value = str(roblox_user.age_days)
+            case "group-rank" if roblox_user:
+                nick_value = group_roleset_name
             case "discord-name":
                 nick_value = member.username
             case "discord-nick":
@@ -743,26 +793,23 @@ async def parse_template(
                 nick_value = group_bind.entity.url if group_bind else ""
             case "group-name":
                 nick_value = group_bind.entity.name if group_bind else ""
-            case "smart-name":
-                nick_value = smart_name
             case "verify-url":
                 nick_value = "https://blox.link/verify"
+            case _ if roblox_user and not nick_fn and nick_value.startswith("group-rank-"):
+                # {group-rank-<group_id>}
+                group_id = nick_value.removeprefix("group-rank-")
+                group = (roblox_user.groups or {}).get(int(group_id)) if group_id.isdigit() else None
+                nick_value = group.role.name if group else "Guest"
 
-        if nick_fn:
-            if nick_fn in ("allC", "allL"):
-                if nick_fn == "allC":
-                    nick_value = nick_value.upper()
-                elif nick_fn == "allL":
-                    nick_value = nick_value.lower()
+        if nick_fn == "allC":
+            nick_value = nick_value.upper()
+        elif nick_fn == "allL":
+            nick_value = nick_value.lower()
 
-                template = template.replace(
-                    "{{{0}}}".format(outer_nick), nick_value)
-            else:
-                template = template.replace("{{{0}}}".format(
-                    outer_nick), outer_nick)  # remove {} only
-        else:
-            template = template.replace(
-                "{{{0}}}".format(outer_nick), nick_value)
+        nickname_parts.append(nick_value)
+
+    nickname_parts.append(template_tail)
+    template = "".join(nickname_parts)
 
     if trim_nickname:
         return template[:32]
@@ -770,6 +817,15 @@ async def parse_template(
     return template
 
 
+def _bind_key(bind: GuildBind) -> tuple:
+    """A hashable key with the same fields as GuildBind.__eq__, for deduplicating binds in one pass."""
+
+    criteria = bind.criteria
+    group = tuple(criteria.group.__dict__.items()) if criteria.group else None
+
+    return (criteria.type, criteria.id, group, tuple(bind.roles), tuple(bind.remove_roles), bind.nickname)
+
+
 async def migrate_old_binds_to_v4(guild_id: str, binds: list[GuildBind]) -> list[GuildBind]:
     """Migrates binds from the V3 structure to V4 and optionally saves them to the database.
 
@@ -789,8 +845,15 @@ async def migrate_old_binds_to_v4(guild_id: str, binds: list[GuildBind]) -> list
         new_migrated_binds = GuildBind.from_V3(guild_data)
 
     if new_migrated_binds:
-        # Remove duplicates
-        binds.extend(b for b in new_migrated_binds if b not in binds)
+        # Remove duplicates, including among the migrated binds themselves
+        seen = {_bind_key(b) for b in binds}
+
+        for bind in new_migrated_binds:
+            key = _bind_key(bind)
+
+            if key not in seen:
+                seen.add(key)
+                binds.append(bind)
 
         if SAVE_NEW_BINDS:
             await database.update_guild_data(
@@ -1,13 +1,17 @@
+from typing import Literal
 from pydantic import Field
 from ..fetch import fetch_typed
-from .base import BaseModel, get_entity
+from .base import FrozenResponseModel, get_entity, register_entity
 from .base_assets import RobloxBaseAsset
 
 
+__all__ = ("GAMEPASS_API", "RobloxGamepassResponse", "RobloxGamepass", "get_gamepass")
+
+
 GAMEPASS_API = "https://economy.roblox.com/v1/game-pass"
 
 
-class RobloxGamepassResponse(BaseModel):
+class RobloxGamepassResponse(FrozenResponseModel):
     """Representation of the response from the Roblox Gamepass API."""
 
     id: int = Field(alias="TargetId")
@@ -15,10 +19,11 @@ class RobloxGamepassResponse(BaseModel):
     description: str = Field(alias="Description")
 
 
+@register_entity("gamepass")
 class RobloxGamepass(RobloxBaseAsset):
     """Representation of a Gamepass on Roblox."""
 
-    type: str = "gamepass"
+    type: Literal["gamepass"] = "gamepass"
 
     async def sync(self):
         """Load Gamepass data from Roblox"""
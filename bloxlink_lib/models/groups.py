@@ -7,11 +7,24 @@ from pydantic import Field
 
 from ..exceptions import RobloxAPIError, RobloxNotFound
 from ..fetch import fetch_typed
-from .base import BaseModel, RobloxEntity
+from .base import BaseModel, RobloxEntity, register_entity
 
 if TYPE_CHECKING:
     from .users import RobloxUser
 
+
+__all__ = (
+    "GROUP_API",
+    "ROBLOX_GROUP_REGEX",
+    "GroupRoleset",
+    "RobloxRoleset",
+    "RobloxGroupOwner",
+    "RobloxGroupResponse",
+    "RobloxGroup",
+    "get_group",
+)
+
+
 GROUP_API = "https://groups.roblox.com/v1/groups"
 ROBLOX_GROUP_REGEX = re.compile(r"roblox.com/groups/(\d+)/")
 
@@ -57,6 +70,7 @@ class RobloxGroupResponse(BaseModel):
     has_verified_badge: bool = Field(alias="hasVerifiedBadge")
 
 
+@register_entity("group")
 class RobloxGroup(RobloxEntity):
     """Representation of a Group on Roblox.
 
@@ -5,6 +5,18 @@ from .base import Snowflake, BaseModel
 import bloxlink_lib.models.binds as binds_module
 
 
+__all__ = (
+    "UserInfoFieldMapping",
+    "UserInfoWebhook",
+    "Webhooks",
+    "GroupLock",
+    "MagicRoleTypes",
+    "GuildData",
+    "RoleSerializable",
+    "GuildSerializable",
+)
+
+
 class UserInfoFieldMapping(BaseModel):
     """Map a field from Bloxlink-expected to developer-expected"""
 
@@ -48,16 +60,9 @@ class GuildData(BaseModel):
     """Representation of the stored settings for a guild"""
 
     id: int
+    # validated by pydantic-core in one pass, bind dicts from the database and GuildBind instances are both accepted
     binds: Annotated[list[binds_module.GuildBind], Field(default_factory=list)]
 
-    @field_validator("binds", mode="before")
-    @classmethod
-    def transform_binds(cls: Type[Self], binds: list) -> list[binds_module.GuildBind]:
-        if all(isinstance(b, binds_module.GuildBind) for b in binds):
-            return binds
-
-        return [binds_module.GuildBind(**b) for b in binds]
-
     verifiedRoleEnabled: bool = True
     verifiedRoleName: str | None = "Verified"  # deprecated
     verifiedRole: str = None
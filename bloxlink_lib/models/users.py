@@ -9,13 +9,50 @@ import discord
 from ..fetch import fetch, fetch_typed, StatusCodes
 from ..config import CONFIG
 from ..exceptions import RobloxNotFound, RobloxAPIError, UserNotVerified
-from ..database import fetch_user_data, mongo
+from .. import database
+from ..database import fetch_user_data
 from .groups import GroupRoleset
 from .base import Snowflake, BaseModel
 
 if TYPE_CHECKING:
     from .base_assets import RobloxBaseAsset
 
+
+__all__ = (
+    "VALID_INFO_SERVER_SCOPES",
+    "INVENTORY_API",
+    "USERS_API",
+    "USERS_BASE_DATA_API",
+    "USER_GROUPS_API",
+    "USER_BADGES_API",
+    "AVATAR_URLS",
+    "UserData",
+    "UserAvatar",
+    "RobloxUserAvatar",
+    "RobloxUserAvatarResponse",
+    "RobloxGroupResponse",
+    "RobloxUserGroups",
+    "RobloxUserGroupsResponse",
+    "RobloxUserBadge",
+    "RobloxUserBadgeResponse",
+    "RobloxUser",
+    "RobloxUsernameData",
+    "RobloxUsernameResponse",
+    "fetch_roblox_id",
+    "fetch_base_data",
+    "fetch_user_groups",
+    "fetch_user_avatars",
+    "fetch_user_badges",
+    "get_user_account",
+    "get_user",
+    "get_accounts",
+    "reverse_lookup",
+    "get_user_from_string",
+    "MemberSerializable",
+    "fetch_user_data",  # re-exported from database for backwards compatibility
+)
+
+
 VALID_INFO_SERVER_SCOPES: list[Literal["groups", "badges"]] = [
     "groups", "badges"]
 INVENTORY_API = "https://inventory.roblox.com"
@@ -478,7 +515,7 @@ async def reverse_lookup(roblox_user: RobloxUser, exclude_user_id: int | None =
 
     roblox_id = str(roblox_user.id)
 
-    cursor = mongo.bloxlink["users"].find(
+    cursor = database.mongo.bloxlink["users"].find(
         {"$or": [{"robloxID": roblox_id}, {
             "robloxAccounts.accounts": roblox_id}]},
         {"_id": 1},
@@ -6,6 +6,18 @@ from os import listdir, path
 from inspect import iscoroutinefunction
 from types import ModuleType
 
+from .utils import create_task_log_exception
+
+
+__all__ = (
+    "deferred_module_functions",
+    "execute_deferred_module_functions",
+    "load_module",
+    "load_module_async",
+    "load_modules",
+    "defer_execution",
+)
+
 
 deferred_module_functions: list[Callable, Coroutine] = []
 
@@ -30,18 +42,11 @@ def execute_deferred_module_functions(*args):
     deferred_module_functions.clear()
 
 
-def load_module(import_name: str, *args) -> ModuleType:
-    """Utility function to import python modules.
-
-    Args:
-        import_name (str): Name of the module to import
-        *args: Arguments to pass to the __setup__ function
-    """
-
+def _import_module(import_name: str) -> ModuleType:
     logging.info(f"Attempting to load module {import_name}")
 
     try:
-        module = importlib.import_module(import_name)
+        return importlib.import_module(import_name)
 
     except (ImportError, ModuleNotFoundError) as e:
         logging.error(f"Failed to import {import_name}: {e}")
@@ -52,10 +57,39 @@ def load_module(import_name: str, *args) -> ModuleType:
         logging.exception(e)
         raise
 
+
+def _finish_loading(import_name: str, module: ModuleType) -> ModuleType:
+    if hasattr(module, "__defer__"):
+        logging.info(f"Deferring module {import_name} __defer__ function")
+        deferred_module_functions.append(module.__defer__)
+
+    logging.info(f"Loaded module {import_name}")
+
+    return module
+
+
+def load_module(import_name: str, *args) -> ModuleType:
+    """Utility function to import python modules.
+
+    An async __setup__ is run to completion when no event loop is running. Inside a running loop it
+    is scheduled as a task instead, use load_module_async to wait for it.
+
+    Args:
+        import_name (str): Name of the module to import
+        *args: Arguments to pass to the __setup__ function
+    """
+
+    module = _import_module(import_name)
+
     if hasattr(module, "__setup__"):
         try:
             if iscoroutinefunction(module.__setup__):
-                asyncio.run(module.__setup__(*args))
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    asyncio.run(module.__setup__(*args))
+                else:
+                    create_task_log_exception(module.__setup__(*args))
             else:
                 module.__setup__(*args)
 
@@ -65,13 +99,33 @@ def load_module(import_name: str, *args) -> ModuleType:
             logging.exception(e)
             raise e
 
-    if hasattr(module, "__defer__"):
-        logging.info(f"Deferring module {import_name} __defer__ function")
-        deferred_module_functions.append(module.__defer__)
+    return _finish_loading(import_name, module)
 
-    logging.info(f"Loaded module {import_name}")
 
-    return module
+async def load_module_async(import_name: str, *args) -> ModuleType:
+    """Like load_module, but awaits an async __setup__ on the running event loop.
+
+    Args:
+        import_name (str): Name of the module to import
+        *args: Arguments to pass to the __setup__ function
+    """
+
+    module = _import_module(import_name)
+
+    if hasattr(module, "__setup__"):
+        try:
+            if iscoroutinefunction(module.__setup__):
+                await module.__setup__(*args)
+            else:
+                module.__setup__(*args)
+
+        except Exception as e:
+            logging.error(
+                f"Module {import_name} __setup__ function errored: {e}")
+            logging.exception(e)
+            raise e
+
+    return _finish_loading(import_name, module)
 
 
 def load_modules(*paths: tuple[str], starting_path: str = ".", execute_deferred_modules: bool = True, init_functions: list[Any] = None) -> list[ModuleType]:
@@ -2,6 +2,7 @@ from typing import Callable, Iterable, Awaitable, Type
 import logging
 import asyncio
 import enum
+from functools import cache
 from os import getenv
 import sentry_sdk
 from sentry_sdk.integrations.aiohttp import AioHttpIntegration
@@ -9,6 +10,18 @@ from .models.base import BaseModel
 from .config import CONFIG
 
 
+__all__ = (
+    "Environment",
+    "find",
+    "create_task_log_exception",
+    "get_node_id",
+    "get_node_count",
+    "parse_into",
+    "get_environment",
+    "init_sentry",
+)
+
+
 class Environment(enum.Enum):
     """Environment types."""
 
@@ -68,6 +81,13 @@ def get_node_count() -> int:
     return shard_count // shards_per_node
 
 
+@cache
+def _alias_map(model: Type[BaseModel]) -> tuple[tuple[str, str | None], ...]:
+    """The (field name, alias) pairs of a model, computed on the first parse_into() call for it."""
+
+    return tuple((field_name, field.alias) for field_name, field in model.model_fields_index())
+
+
 def parse_into[T: BaseModel | dict](data: dict, model: Type[T]) -> T:
     """Parse a dictionary into a dataclass.
 
@@ -81,8 +101,11 @@ def parse_into[T: BaseModel | dict](data: dict, model: Type[T]) -> T:
 
     if issubclass(model, BaseModel):
         # Filter only relevant fields before constructing the pydantic instance
-        relevant_fields = {field_name: data.get(field_name, data.get(
-            field.alias)) for field_name, field in model.model_fields.items() if field_name in data or field.alias in data}
+        relevant_fields = {
+            field_name: data[field_name] if field_name in data else data[alias]
+            for field_name, alias in _alias_map(model)
+            if field_name in data or (alias and alias in data)
+        }
 
         return model(**relevant_fields)
 
@@ -15,6 +15,8 @@ def event_loop(request):
 def start_docker_services(docker_services):
     """Start the Docker services."""
 
+    database.connect_database()
+
 
 @pytest.fixture(scope="function")
 async def wait_for_redis():
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from bloxlink_lib import database
 from pydantic import ValidationError
@@ -25,3 +26,27 @@ class TestUpdatingGuildData:
             await database.update_guild_data(1, verifiedRoleName=test_input)
 
         assert issubclass(e.type, ValidationError)
+
+    async def test_read_after_concurrent_write(self, start_docker_services, wait_for_redis):
+        """Test that a fetch racing an update doesn't leave stale data in the local cache."""
+
+        await database.update_guild_data(1, verifiedRoleName="before")
+        await database.fetch_guild_data(1, "verifiedRoleName")
+
+        await asyncio.gather(
+            database.update_guild_data(1, verifiedRoleName="after"),
+            database.fetch_guild_data(1, "verifiedRoleName"),
+        )
+
+        assert (await database.fetch_guild_data(1, "verifiedRoleName")).verifiedRoleName == "after"
+
+    async def test_local_cache_disabled(self, start_docker_services, wait_for_redis, monkeypatch):
+        """Test that nothing is kept in the local cache when it's turned off."""
+
+        monkeypatch.setattr(database, "_LOCAL_CACHE_ENABLED", False)
+        database._local_cache.clear()
+
+        await database.update_guild_data(1, verifiedRoleName="uncached")
+
+        assert (await database.fetch_guild_data(1, "verifiedRoleName")).verifiedRoleName == "uncached"
+        assert not database._local_cache
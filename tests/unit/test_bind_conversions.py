@@ -1,4 +1,5 @@
 from bloxlink_lib.models import binds
+from bloxlink_lib.models.guilds import GuildData
 from .fixtures.binds import *
 
 
@@ -72,3 +73,44 @@ class TestConvertV3RoleBindsToV4:
         """Test that the converted binds don't equal different binds."""
 
         assert v3_rolebinds_1[1] != v3_rolebinds_2[1]
+
+
+class TestMigrateBindsToV4:
+    """Tests for migrating stored V3 binds into a guild's V4 binds."""
+
+    def test_bind_key_matches_equal_binds(self, v3_rolebinds_1):  # pylint: disable=W0621
+        """Test that equal binds share a key and different binds don't."""
+
+        converted_bind = binds.GuildBind.from_V3(v3_rolebinds_1[0])[0]
+        correct_bind = v3_rolebinds_1[1][0]
+
+        assert converted_bind == correct_bind
+        assert binds._bind_key(converted_bind) == binds._bind_key(correct_bind)
+
+        correct_bind.nickname = "different"
+
+        assert binds._bind_key(converted_bind) != binds._bind_key(correct_bind)
+
+    async def test_migrate_skips_existing_binds(self, v3_rolebinds_1, monkeypatch):  # pylint: disable=W0621
+        """Test that migrated binds which are already in the V4 binds aren't added twice."""
+
+        async def fetch_guild_data(guild_id, *_aspects):
+            return GuildData(id=guild_id, **v3_rolebinds_1[0])
+
+        monkeypatch.setattr(binds.database, "fetch_guild_data", fetch_guild_data)
+
+        existing_binds = [v3_rolebinds_1[1][0]]
+        migrated_binds = await binds.migrate_old_binds_to_v4(1, existing_binds)
+
+        assert migrated_binds == v3_rolebinds_1[1]
+        assert len({binds._bind_key(bind) for bind in migrated_binds}) == len(migrated_binds)
+
+    async def test_migrate_skips_migrated_guilds(self, v3_rolebinds_1, monkeypatch):  # pylint: disable=W0621
+        """Test that guilds which were already migrated keep their binds."""
+
+        async def fetch_guild_data(guild_id, *_aspects):
+            return GuildData(id=guild_id, migratedBindsToV4=True, **v3_rolebinds_1[0])
+
+        monkeypatch.setattr(binds.database, "fetch_guild_data", fetch_guild_data)
+
+        assert await binds.migrate_old_binds_to_v4(1, []) == []
@@ -1,6 +1,7 @@
 import pytest
 import datetime
 from bloxlink_lib.models import binds
+from bloxlink_lib import RobloxEntity, RobloxNotFound, RoleSerializable
 
 # fixtures
 from pytest_lazy_fixtures import lf, lfc
@@ -39,6 +40,16 @@ class TestNicknames:
         ("{discord-nick}", lf("test_discord_member.nickname")),
         ("{discord-global-name}", lf("test_discord_member.global_name")),
         ("{discord-id}", lfc("{}".format, lf("test_discord_member.id"))),
+        ("{discord-mention}", lf("test_discord_member.mention")),
+
+        # other templates
+        ("{server-name}", lf("test_guild_1.name")),
+        ("{prefix}", "/"),
+        ("{verify-url}", "https://blox.link/verify"),
+        ("{group-rank-1337}", "Guest"),
+        ("{allC:roblox-name}", lfc(str.upper, lf("test_roblox_user_1.username"))),
+        ("{capA:roblox-name}", "capA:roblox-name"),
+        ("{unknown-template}", "unknown-template"),
 
         # combined
         ("[{group-rank}] {roblox-name}",
@@ -62,3 +73,87 @@ class TestNicknames:
         )
 
         assert nickname == expected_nickname
+
+
+class FailingEntity(RobloxEntity):
+    """Entity whose sync fails like a missing Roblox entity."""
+
+    async def sync(self):
+        raise RobloxNotFound("This entity does not exist.")
+
+
+class TestBindsDescription:
+    """Tests related to describing a guild's binds."""
+
+    async def test_failed_sync_raises_original_exception(self, monkeypatch):
+        """Test that a failed entity sync is not wrapped in an ExceptionGroup."""
+
+        bind = binds.GuildBind(criteria={"type": "badge", "id": 1}, entity=FailingEntity(id=1))
+
+        async def get_binds(*_args, **_kwargs):
+            return [bind]
+
+        monkeypatch.setattr(binds, "get_binds", get_binds)
+
+        with pytest.raises(RobloxNotFound):
+            await binds.build_binds_desc(1)
+
+
+class TestHighestRole:
+    """Tests related to a bind's highest role."""
+
+    @pytest.fixture
+    def guild_roles(self) -> dict[int, RoleSerializable]:
+        return {
+            role_id: RoleSerializable(id=role_id, name=f"Role {role_id}", position=position)
+            for role_id, position in ((1, 3), (2, 7), (3, 5))
+        }
+
+    def test_highest_role(self, guild_roles):
+        """Test that the bind role with the highest position is picked."""
+
+        bind = binds.GuildBind(criteria={"type": "badge", "id": 1}, nickname="{roblox-name}", roles=["1", "2"])
+        bind.calculate_highest_role(guild_roles)
+
+        assert bind.highest_role.id == 2
+
+    def test_highest_role_no_matching_roles(self, guild_roles):
+        """Test that no highest role is set when none of the bind's roles are in the guild."""
+
+        bind = binds.GuildBind(criteria={"type": "badge", "id": 1}, nickname="{roblox-name}", roles=["4"])
+        bind.calculate_highest_role(guild_roles)
+
+        assert bind.highest_role is None
+
+    def test_highest_role_without_nickname(self, guild_roles):
+        """Test that binds without a nickname are skipped."""
+
+        bind = binds.GuildBind(criteria={"type": "badge", "id": 1}, roles=["1", "2"])
+        bind.calculate_highest_role(guild_roles)
+
+        assert bind.highest_role is None
+
+
+class TestTemplateCompilation:
+    """Tests related to splitting nickname templates into tokens."""
+
+    @pytest.mark.parametrize("template,expected_parts,expected_tail", [
+        ("{roblox-name}", (("", "roblox-name", None, "roblox-name"),), ""),
+        ("[{group-rank}] {roblox-name}!", (
+            ("[", "group-rank", None, "group-rank"),
+            ("] ", "roblox-name", None, "roblox-name"),
+        ), "!"),
+        ("{group-rank-1337}", (("", "group-rank-1337", None, "group-rank-1337"),), ""),
+        ("{allC:roblox-name}", (("", "allC:roblox-name", "allC", "roblox-name"),), ""),
+        ("no tokens", (), "no tokens"),
+        ("", (), ""),
+    ])
+    def test_compile_template(self, template, expected_parts, expected_tail):
+        """Test that each token is split into its literal prefix, function and value."""
+
+        assert binds._compile_template(template) == (expected_parts, expected_tail)
+
+    def test_compile_template_cached(self):
+        """Test that a template is only compiled once."""
+
+        assert binds._compile_template("{roblox-name}") is binds._compile_template("{roblox-name}")
@@ -0,0 +1,99 @@
+import asyncio
+from typing import ClassVar
+import pytest
+from pydantic import Field
+from bloxlink_lib import RobloxEntity, RobloxNotFound, register_entity, get_entities, get_entity, invalidate_entity
+from bloxlink_lib.models import base
+
+
+@register_entity("test")
+class CountingEntity(RobloxEntity):
+    """Entity that counts its syncs instead of calling Roblox."""
+
+    roles: dict[int, str] = Field(default_factory=dict)
+
+    syncs: ClassVar[int] = 0
+    fail: ClassVar[bool] = False
+    missing: ClassVar[set[int]] = set()
+
+    async def sync(self):
+        CountingEntity.syncs += 1
+        await asyncio.sleep(0)
+
+        if CountingEntity.fail or self.id in CountingEntity.missing:
+            raise RobloxNotFound("This entity does not exist.")
+
+        self.roles = {1: "Member"}
+        self.synced = True
+
+
+@pytest.fixture(autouse=True)
+def reset_entities():
+    """Start every test with an empty entity cache."""
+    base._entity_cache.clear()
+    CountingEntity.syncs = 0
+    CountingEntity.fail = False
+    CountingEntity.missing = set()
+
+
+class TestGetEntity:
+    """Tests related to getting cached entities."""
+
+    async def test_cache_hit(self):
+        """Test that a cached entity is not synced again."""
+        first = await get_entity("test", 1)
+        second = await get_entity("test", "1")
+
+        assert CountingEntity.syncs == 1
+        assert first.synced and second.synced
+
+    async def test_copies_are_independent(self):
+        """Test that mutating a returned entity doesn't change the cached one."""
+        first = await get_entity("test", 1)
+        first.roles[2] = "Admin"
+
+        assert (await get_entity("test", 1)).roles == {1: "Member"}
+
+    async def test_concurrent_syncs_coalesce(self):
+        """Test that concurrent calls for the same entity share one sync."""
+        entities = await asyncio.gather(*(get_entity("test", 1) for _ in range(5)))
+
+        assert CountingEntity.syncs == 1
+        assert len({id(entity) for entity in entities}) == 5
+
+    async def test_failed_sync_not_cached(self):
+        """Test that a failed sync is raised and retried on the next call."""
+        CountingEntity.fail = True
+
+        with pytest.raises(RobloxNotFound):
+            await get_entity("test", 1)
+
+        CountingEntity.fail = False
+
+        assert (await get_entity("test", 1)).synced
+        assert CountingEntity.syncs == 2
+
+    async def test_invalidate_entity(self):
+        """Test that an invalidated entity is synced again."""
+        await get_entity("test", 1)
+        invalidate_entity("test", "1")
+        await get_entity("test", 1)
+
+        assert CountingEntity.syncs == 2
+
+
+class TestGetEntities:
+    """Tests related to getting many entities at once."""
+
+    async def test_keeps_input_order(self):
+        """Test that the entities are returned in the order they were asked for."""
+        entities = await get_entities([("test", 3), ("test", 1), ("test", 2)])
+
+        assert [entity.id for entity in entities] == [3, 1, 2]
+
+    async def test_failed_sync_raises_original_exception(self):
+        """Test that a failed sync is not wrapped in an ExceptionGroup."""
+        CountingEntity.missing = {2}
+
+        with pytest.raises(RobloxNotFound):
+            await get_entities([("test", 1), ("test", 2)])
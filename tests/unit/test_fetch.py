@@ -0,0 +1,150 @@
+import asyncio
+import importlib
+import pytest
+from aiohttp import web
+from bloxlink_lib import RobloxAPIError, RobloxDown, StatusCodes, close_session, fetch
+
+fetch_module = importlib.import_module("bloxlink_lib.fetch")
+
+
+class FakeResponse:
+    """Only the headers of a response, which is all _retry_delay reads."""
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+
+
+@pytest.fixture
+async def roblox_server():
+    """A local server that fails with the queued statuses before responding with 200."""
+
+    state = {"statuses": [], "hits": 0}
+
+    async def handler(_request):
+        state["hits"] += 1
+
+        if state["statuses"]:
+            return web.Response(status=state["statuses"].pop(0))
+
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_route("*", "/", handler)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    port = site._server.sockets[0].getsockname()[1]  # pylint: disable=protected-access
+    state["url"] = f"http://127.0.0.1:{port}/"
+
+    yield state
+
+    await close_session()
+    await runner.cleanup()
+
+
+class TestRetries:
+    """Tests related to retrying rate limited and unavailable requests."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        monkeypatch.setattr(fetch_module, "_RETRY_BACKOFF", 0.01)
+
+    @pytest.mark.parametrize("method, statuses", [
+        ("GET", [429]), ("GET", [429, 503]), ("GET", [503, 503]), ("PUT", [503]), ("POST", [429, 429]),
+    ])
+    async def test_retry_until_ok(self, roblox_server, method, statuses):
+        """Test that 429 and 503 responses are retried until the request succeeds."""
+
+        roblox_server["statuses"] = list(statuses)
+        data, response = await fetch(method, roblox_server["url"])
+
+        assert data == {"ok": True} and response.status == 200
+        assert roblox_server["hits"] == len(statuses) + 1
+
+    async def test_retries_exhausted(self, roblox_server):
+        """Test that a request still unavailable after the last retry raises RobloxDown."""
+
+        roblox_server["statuses"] = [503] * 3
+
+        with pytest.raises(RobloxDown):
+            await fetch("GET", roblox_server["url"])
+
+        assert roblox_server["hits"] == 3
+
+    async def test_other_errors_not_retried(self, roblox_server):
+        """Test that other failures are raised without retrying."""
+
+        roblox_server["statuses"] = [500]
+
+        with pytest.raises(RobloxAPIError):
+            await fetch("GET", roblox_server["url"])
+
+        assert roblox_server["hits"] == 1
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    async def test_non_idempotent_not_retried_on_503(self, roblox_server, method):
+        """Test that a 503 isn't retried for methods that aren't safe to send twice."""
+
+        roblox_server["statuses"] = [503]
+
+        with pytest.raises(RobloxDown):
+            await fetch(method, roblox_server["url"], body={"a": 1})
+
+        assert roblox_server["hits"] == 1
+
+
+class TestRetryDelay:
+    """Tests related to the delay between retries."""
+
+    @pytest.mark.parametrize("attempt, expected_delay", [(0, 0.5), (1, 1.0)])
+    def test_backoff(self, attempt, expected_delay):
+        """Test that the delay doubles on every retry without a Retry-After header."""
+
+        assert fetch_module._retry_delay(FakeResponse({}), attempt) == expected_delay
+
+    @pytest.mark.parametrize("retry_after, expected_delay", [("2", 2), ("60", 5), ("soon", 0.5)])
+    def test_retry_after(self, retry_after, expected_delay):
+        """Test that Retry-After is used, capped to the maximum delay, and ignored if it isn't seconds."""
+
+        assert fetch_module._retry_delay(FakeResponse({"Retry-After": retry_after}), 0) == expected_delay
+
+
+class TestSession:
+    """Tests related to the shared session."""
+
+    def test_session_per_event_loop(self):
+        """Test that a session isn't reused from another event loop."""
+
+        async def get_session():
+            return fetch_module._get_session()
+
+        first_loop, second_loop = asyncio.new_event_loop(), asyncio.new_event_loop()
+
+        try:
+            first_session = first_loop.run_until_complete(get_session())
+            second_session = second_loop.run_until_complete(get_session())
+
+            assert first_session is not second_session
+            assert second_loop.run_until_complete(get_session()) is second_session
+
+            second_loop.run_until_complete(close_session())
+
+            assert first_session.closed and second_session.closed, "close_session() should close every loop's session."
+        finally:
+            first_loop.close()
+            second_loop.close()
+
+
+class TestStatusCodes:
+    """Tests related to the StatusCodes enum."""
+
+    def test_status_codes_enum(self):
+        """Test that status codes can be looked up, named and compared with plain ints."""
+
+        assert StatusCodes(404) is StatusCodes.NOT_FOUND
+        assert StatusCodes.NOT_FOUND.name == "NOT_FOUND"
+        assert StatusCodes.OK == 200
+        assert 429 in {*StatusCodes}
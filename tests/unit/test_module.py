@@ -0,0 +1,65 @@
+import asyncio
+import sys
+import pytest
+from bloxlink_lib import deferred_module_functions, load_module, load_module_async
+
+MODULE_SOURCE = """
+calls = []
+
+async def __setup__(*args):
+    await asyncio.sleep(0)
+    calls.append(args)
+
+def __defer__(*args):
+    pass
+"""
+
+
+@pytest.fixture
+def setup_module(tmp_path, monkeypatch, request):
+    """Write a module with an async __setup__ and return its import name."""
+
+    import_name = f"setup_module_{request.node.name.replace('[', '_').replace(']', '_')}"
+    (tmp_path / f"{import_name}.py").write_text("import asyncio\n" + MODULE_SOURCE)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    yield import_name
+
+    sys.modules.pop(import_name, None)
+    deferred_module_functions.clear()
+
+
+class TestLoadModule:
+    """Tests related to loading modules and running their __setup__."""
+
+    def test_load_module_without_loop(self, setup_module, event_loop):
+        """Test that an async __setup__ runs to completion when no event loop is running."""
+
+        module = load_module(setup_module, "arg")
+
+        # asyncio.run() unsets the current loop, which the async tests still need
+        asyncio.set_event_loop(event_loop)
+
+        assert module.calls == [("arg",)]
+        assert module.__defer__ in deferred_module_functions
+
+    async def test_load_module_with_running_loop(self, setup_module):
+        """Test that an async __setup__ is scheduled as a task inside a running event loop."""
+
+        module = load_module(setup_module, "arg")
+
+        assert module.calls == []
+
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert module.calls == [("arg",)]
+
+    async def test_load_module_async(self, setup_module):
+        """Test that load_module_async waits for an async __setup__."""
+
+        module = await load_module_async(setup_module, "arg")
+
+        assert module.calls == [("arg",)]
+        assert module.__defer__ in deferred_module_functions
@@ -1,4 +1,5 @@
-from bloxlink_lib import CoerciveSet, SnowflakeSet
+import pickle
+from bloxlink_lib import BaseModel, CoerciveSet, SnowflakeSet
 import pytest
 
 
@@ -159,6 +160,34 @@ class TestCoerciveSets:
         assert len(test_set) == 0, "CoerciveSet should be empty."
 
 
+    def test_coercive_set_class_getitem(self):
+        """Test that parametrizing the same type returns the same class"""
+        assert CoerciveSet[int] is CoerciveSet[int], "CoerciveSet[int] should be created once."
+        assert CoerciveSet[int].__name__ == "CoerciveSet[int]", "CoerciveSet[int] should be named after its type."
+        assert CoerciveSet[int] is not CoerciveSet[str], "Each type should get its own class."
+
+    @pytest.mark.parametrize("operation, others, expected", [
+        ("intersection", ([2, 3, "4"], ["3", 4]), {3, 4}),
+        ("difference", ([1], ["2"]), {3, 4}),
+        ("symmetric_difference", ([4, "5"],), {1, 2, 3, 5}),
+        ("union", ([5], ("6",)), {1, 2, 3, 4, 5, 6}),
+    ])
+    def test_coercive_set_operations(self, operation, others, expected):
+        """Test that the set operations coerce every input and keep the set type"""
+        test_set = CoerciveSet[int]([1, 2, 3, 4])
+        result = getattr(test_set, operation)(*others)
+        assert set(result) == expected, f"{operation} should return {expected}."
+        assert type(result) is CoerciveSet[int], f"{operation} should return a CoerciveSet[int]."
+        assert set(test_set) == {1, 2, 3, 4}, f"{operation} should not change the original set."
+
+    def test_coercive_set_pickle(self):
+        """Test that a parametrized coercive set survives pickling"""
+        test_set = CoerciveSet[int]([1, 2, 3])
+        unpickled = pickle.loads(pickle.dumps(test_set))
+        assert type(unpickled) is CoerciveSet[int], "Unpickling should return a CoerciveSet[int]."
+        assert unpickled == test_set, "Unpickling should keep the items."
+
+
 class TestSnowflakeSets:
     """Tests for SnowflakeSets"""
 
@@ -214,3 +243,50 @@ class TestSnowflakeSets:
 
         test_set = SnowflakeSet()
         assert len(test_set) == 0, "SnowflakeSet should be empty."
+
+    @pytest.mark.parametrize("operation", ["intersection", "difference", "symmetric_difference", "union"])
+    def test_snowflake_set_operations_keep_attributes(self, operation):
+        """Test that the set operations keep the type and str_reference"""
+        test_set = SnowflakeSet([1, 2, 3], type="role", str_reference={1: "Admin"})
+        result = getattr(test_set, operation)([2, 4])
+        assert type(result) is SnowflakeSet, f"{operation} should return a SnowflakeSet."
+        assert result.type == "role", f"{operation} should keep the type."
+        assert result.str_reference == {1: "Admin"}, f"{operation} should keep the str_reference."
+
+    def test_snowflake_set_pickle(self):
+        """Test that a snowflake set survives pickling"""
+        test_set = SnowflakeSet([1, 2], type="user", str_reference={1: "bob"})
+        unpickled = pickle.loads(pickle.dumps(test_set))
+        assert unpickled == test_set, "Unpickling should keep the items."
+        assert (unpickled.type, unpickled.str_reference) == ("user", {1: "bob"}), "Unpickling should keep the attributes."
+
+    def test_snowflake_set_model_field(self):
+        """Test that a model field keeps a snowflake set instance and coerces other input"""
+
+        class RoleModel(BaseModel):
+            roles: SnowflakeSet
+
+        test_set = SnowflakeSet([1, 2], type="role")
+        assert RoleModel(roles=test_set).roles is test_set, "A SnowflakeSet should be passed through as is."
+
+        model = RoleModel(roles=["1", 2])
+        assert type(model.roles) is SnowflakeSet and set(model.roles) == {1, 2}, "A list should be coerced."
+
+    def test_snowflake_set_stored_shape(self):
+        """Test that the shape stored while SnowflakeSet was a pydantic model is still read and written"""
+
+        class RoleModel(BaseModel):
+            roles: SnowflakeSet
+            names: CoerciveSet[str]
+
+        stored = {
+            "roles": {"root": [1, 2], "type": "role", "str_reference": {1: "Admin"}},
+            "names": {"root": ["a"]},
+        }
+        model = RoleModel.model_validate(stored)
+
+        assert set(model.roles) == {1, 2} and model.roles.type == "role", "The stored items and type should be read."
+        assert model.roles.str_reference == {1: "Admin"}, "The stored str_reference should be read."
+        assert set(model.names) == {"a"}, "A stored CoerciveSet should be read."
+        assert model.model_dump() == stored, "The sets should serialize into the stored shape."
+        assert RoleModel.model_validate_json(model.model_dump_json()).roles == model.roles, "JSON should round-trip."